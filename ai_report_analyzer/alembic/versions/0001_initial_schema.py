@@ -0,0 +1,51 @@
+"""Initial schema
+
+Matches the tables the application used to create with Base.metadata.create_all,
+so existing databases can be brought under Alembic with 'alembic stamp 0001'
+followed by 'alembic upgrade head'.
+
+Revision ID: 0001
+Revises:
+Create Date: 2026-10-15 00:00:00
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+revision = "0001"
+down_revision = None
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    op.create_table(
+        "reports",
+        sa.Column("id", sa.Integer(), primary_key=True),
+        sa.Column("filename", sa.String()),
+        sa.Column("upload_date", sa.DateTime(timezone=True), server_default=sa.func.now()),
+        sa.Column("total_rows", sa.Integer()),
+        sa.Column("summary_text", sa.Text()),
+        sa.Column("insight_score", sa.Float())
+    )
+    op.create_index("ix_reports_id", "reports", ["id"])
+    op.create_index("ix_reports_filename", "reports", ["filename"])
+
+    op.create_table(
+        "metrics",
+        sa.Column("id", sa.Integer(), primary_key=True),
+        sa.Column("report_id", sa.Integer()),
+        sa.Column("metric_name", sa.String()),
+        sa.Column("metric_value", sa.Float())
+    )
+    op.create_index("ix_metrics_id", "metrics", ["id"])
+    op.create_index("ix_metrics_report_id", "metrics", ["report_id"])
+
+
+def downgrade():
+    op.drop_index("ix_metrics_report_id", table_name="metrics")
+    op.drop_index("ix_metrics_id", table_name="metrics")
+    op.drop_table("metrics")
+    op.drop_index("ix_reports_filename", table_name="reports")
+    op.drop_index("ix_reports_id", table_name="reports")
+    op.drop_table("reports")
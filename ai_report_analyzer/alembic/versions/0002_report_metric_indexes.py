@@ -0,0 +1,39 @@
+"""Metric foreign key and report listing indexes
+
+Adds the metrics.report_id foreign key (ON DELETE CASCADE) and the composite
+(report_id, metric_name) index, indexes reports.upload_date descending for the
+newest-first listing, and drops the unused reports.filename index.
+
+Revision ID: 0002
+Revises: 0001
+Create Date: 2026-10-15 00:00:00
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+revision = "0002"
+down_revision = "0001"
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    op.alter_column("metrics", "report_id", existing_type=sa.Integer(), nullable=False)
+    op.create_foreign_key(
+        "metrics_report_id_fkey", "metrics", "reports",
+        ["report_id"], ["id"], ondelete="CASCADE"
+    )
+    op.create_index("ix_metric_report_name", "metrics", ["report_id", "metric_name"])
+
+    op.drop_index("ix_reports_filename", table_name="reports")
+    op.create_index("ix_reports_upload_date", "reports", [sa.text("upload_date DESC")])
+
+
+def downgrade():
+    op.drop_index("ix_reports_upload_date", table_name="reports")
+    op.create_index("ix_reports_filename", "reports", ["filename"])
+
+    op.drop_index("ix_metric_report_name", table_name="metrics")
+    op.drop_constraint("metrics_report_id_fkey", "metrics", type_="foreignkey")
+    op.alter_column("metrics", "report_id", existing_type=sa.Integer(), nullable=True)
@@ -0,0 +1,26 @@
+"""Report processing status
+
+Adds reports.status for the background AI analysis. Reports that already exist
+were analyzed synchronously before this revision, so they are marked "done".
+
+Revision ID: 0003
+Revises: 0002
+Create Date: 2026-10-15 00:00:00
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+revision = "0003"
+down_revision = "0002"
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    op.add_column("reports", sa.Column("status", sa.String()))
+    op.execute("UPDATE reports SET status = 'done'")
+
+
+def downgrade():
+    op.drop_column("reports", "status")
@@ -0,0 +1,46 @@
+"""Store reports.upload_date as epoch milliseconds
+
+Converts reports.upload_date from timestamptz to BIGINT milliseconds since the
+Unix epoch. Existing values are converted in place; new values are supplied by
+the application, so the now() server default is dropped.
+
+Revision ID: 0004
+Revises: 0003
+Create Date: 2026-10-15 00:00:00
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+revision = "0004"
+down_revision = "0003"
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    op.alter_column(
+        "reports", "upload_date",
+        existing_type=sa.DateTime(timezone=True),
+        server_default=None
+    )
+    op.alter_column(
+        "reports", "upload_date",
+        existing_type=sa.DateTime(timezone=True),
+        type_=sa.BigInteger(),
+        postgresql_using="(extract(epoch from upload_date) * 1000)::bigint"
+    )
+
+
+def downgrade():
+    op.alter_column(
+        "reports", "upload_date",
+        existing_type=sa.BigInteger(),
+        type_=sa.DateTime(timezone=True),
+        postgresql_using="to_timestamp(upload_date / 1000.0)"
+    )
+    op.alter_column(
+        "reports", "upload_date",
+        existing_type=sa.DateTime(timezone=True),
+        server_default=sa.func.now()
+    )
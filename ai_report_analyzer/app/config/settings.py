@@ -1,52 +1,58 @@
-import os
-from dotenv import load_dotenv
+from functools import lru_cache
+from typing import Optional
+from pydantic import Field
+from pydantic_settings import BaseSettings, SettingsConfigDict
 
-load_dotenv()
 
-class Settings:
+class Settings(BaseSettings):
     """
     Centralized configuration management class for application settings loaded from environment variables.
 
     This class provides a centralized location for accessing application-wide configuration settings
-    that are loaded from environment variables using the python-dotenv library. It serves as a 
-    single source of truth for sensitive configuration data such as database connections,
-    API keys, and security tokens. The class uses lazy loading through os.getenv() to retrieve
-    values only when accessed, which helps with performance and security by avoiding unnecessary
-    exposure of sensitive information during initialization.
+    that are loaded from environment variables and, for local development, a .env file. It serves
+    as a single source of truth for sensitive configuration data such as database connections,
+    API keys, and security tokens. Values are read and converted to their declared types once,
+    when an instance is created, and the instance is frozen so that every later access is a
+    plain attribute lookup. Missing required values or values of the wrong type fail at startup
+    with a validation error rather than on first use. Use get_settings() rather than
+    instantiating the class directly so that the same instance is shared across the application.
 
     Example:
+        settings = get_settings()
+
         # Access database configuration
-        db_url = Settings.DATABASE_URL
-        
+        db_url = settings.DATABASE_URL
+
         # Access AI service API key
-        api_key = Settings.GEMINI_API_KEY
-        
+        api_key = settings.GEMINI_API_KEY
+
         # Access application secret key
-        secret = Settings.SECRET_KEY
+        secret = settings.SECRET_KEY
     """
 
-    DATABASE_URL = os.getenv("DATABASE_URL")
+    model_config = SettingsConfigDict(env_file=".env", frozen=True, extra="ignore")
+
+    DATABASE_URL: str = Field(repr=False)
     """
     Database connection string loaded from the 'DATABASE_URL' environment variable.
     
     This attribute contains the full database connection URI including protocol, credentials,
     host, port, and database name. Common formats include PostgreSQL ('postgresql://...'),
-    MySQL ('mysql://...'), or SQLite ('sqlite:///...') connection strings. The value is 
-    typically None if the environment variable is not set, so consumers should handle
-    potential None values appropriately.
+    MySQL ('mysql://...'), or SQLite ('sqlite:///...') connection strings. Required: the
+    application refuses to start if it is not set.
     """
 
-    GEMINI_API_KEY = os.getenv("GEMINI_API_KEY")
+    GEMINI_API_KEY: str = Field(repr=False)
     """
     API key for Google's Gemini AI service loaded from the 'GEMINI_API_KEY' environment variable.
     
     This attribute stores the authentication token required to access Google's Gemini AI services
     for machine learning, natural language processing, or other AI capabilities. The API key
     is sensitive information that grants access to potentially costly cloud services and should
-    be protected accordingly. Returns None if the environment variable is not configured.
+    be protected accordingly. Required: the application refuses to start if it is not set.
     """
 
-    SECRET_KEY = os.getenv("SECRET_KEY")
+    SECRET_KEY: Optional[str] = Field(default=None, repr=False)
     """
     Cryptographic secret key loaded from the 'SECRET_KEY' environment variable.
     
@@ -57,9 +63,70 @@ class Settings:
     cause security vulnerabilities in applications that require this key.
     """
 
-settings = Settings()
+    DB_POOL_SIZE: int = 20
+    """
+    Number of persistent connections kept in the database connection pool.
+
+    Loaded from the 'DB_POOL_SIZE' environment variable and defaulting to 20. This should
+    roughly match the number of requests a single API worker is expected to serve
+    concurrently, since each in-flight request holds one connection while it talks to
+    the database. Ignored for SQLite URLs, which use a single shared connection.
+    """
+
+    DB_MAX_OVERFLOW: int = 10
+    """
+    Number of extra connections the pool may open beyond DB_POOL_SIZE under burst load.
+
+    Loaded from the 'DB_MAX_OVERFLOW' environment variable and defaulting to 10. Overflow
+    connections are closed as soon as they are returned to the pool, so this bounds the
+    peak number of connections a worker can open against the database server.
+    """
+
+    AUTO_CREATE_TABLES: bool = False
+    """
+    Whether the API creates missing database tables itself on startup.
+
+    Loaded from the 'AUTO_CREATE_TABLES' environment variable; set it to '1' or 'true' to enable.
+    Disabled by default: deployments apply the schema once with 'alembic upgrade head',
+    so API workers do not each introspect the database catalog while booting. Enabling
+    it is convenient for local development against a throwaway database.
+    """
+
+    MAX_UPLOAD_BYTES: int = 50_000_000
+    """
+    Largest CSV upload, in bytes, that the API accepts.
+
+    Loaded from the 'MAX_UPLOAD_BYTES' environment variable and defaulting to 50 MB.
+    Larger uploads are rejected with 413 before any parsing happens.
+    """
+
+    MAX_UPLOAD_ROWS: int = 1_000_000
+    """
+    Largest number of data rows an uploaded CSV may contain.
+
+    Loaded from the 'MAX_UPLOAD_ROWS' environment variable and defaulting to one million.
+    Larger files are rejected with 413 right after parsing, before aggregation and the
+    billed Gemini call.
+    """
+
+
+@lru_cache(maxsize=1)
+def get_settings():
+    """
+    Return the process-wide Settings instance, reading the environment on first use.
+
+    The instance is built once and cached, so every caller (including FastAPI dependencies
+    declared with Depends(get_settings)) shares the same frozen configuration object.
+
+    Returns:
+        Settings: The application's configuration.
+    """
+    return Settings()
+
+
+settings = get_settings()
 """
-Global instance of the Settings class providing convenient access to application configuration.
+Global Settings instance returned by get_settings(), for convenient module-level access.
 
 This global instance allows modules throughout the application to access configuration settings
 without needing to instantiate the Settings class themselves. It provides a consistent interface
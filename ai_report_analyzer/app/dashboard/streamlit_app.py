@@ -1,42 +1,136 @@
 import streamlit as st
-import pandas as pd
+import pyarrow as pa
 import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+import json
 import os
 
 API_URL = os.getenv("API_URL", "http://api:8000")
 
+@st.cache_resource
+def _session():
+    """
+    Return a pooled HTTP session shared by every rerun of the dashboard script.
+
+    Streamlit re-executes this script on every widget interaction; reusing one
+    keep-alive session avoids opening a new connection to the API on each call.
+    """
+    session = requests.Session()
+    adapter = HTTPAdapter(
+        pool_connections=10,
+        pool_maxsize=10,
+        max_retries=Retry(total=2, backoff_factor=0.2)
+    )
+    session.mount("http://", adapter)
+    session.mount("https://", adapter)
+    return session
+
+@st.cache_data(ttl=30, show_spinner=False)
+def fetch_reports():
+    """
+    Fetch the most recent reports from the API as an Arrow table, memoized for 30 seconds.
+
+    Widget interactions rerun the whole script; caching keeps those reruns from
+    repeating the API round-trip and the table construction. The table is built
+    directly in Arrow, which st.dataframe renders without converting from pandas;
+    upload dates arrive as epoch milliseconds and are cast to a timestamp column.
+    Call fetch_reports.clear() after an upload so the new report shows up immediately.
+    """
+    resp = _session().get(f"{API_URL}/reports", params={"limit": 50}, timeout=5)
+    resp.raise_for_status()
+    table = pa.Table.from_pylist(resp.json())
+    if "upload_date" in table.column_names:
+        upload_dates = table["upload_date"].cast(pa.timestamp("ms", tz="UTC"))
+        table = table.set_column(table.column_names.index("upload_date"), "upload_date", upload_dates)
+    return table
+
+def fetch_report(report_id):
+    """
+    Fetch one report from the API, including its AI summary once analysis is done.
+    """
+    resp = _session().get(f"{API_URL}/reports/{report_id}", timeout=5)
+    resp.raise_for_status()
+    return resp.json()
+
+@st.fragment(run_every=2)
+def await_report(report_id):
+    """
+    Show the status of a freshly uploaded report, re-checking it every two seconds.
+
+    The API accepts uploads with 202 and analyzes them afterwards. Running as a
+    fragment, only this part of the page is refreshed while the report is "pending",
+    so the rest of the dashboard stays responsive. Once the analysis has finished
+    the report is kept in the session state and the whole page is rerun, which
+    renders its insights and stops the polling.
+    """
+    report = fetch_report(report_id)
+    if report["status"] == "pending":
+        st.info(f"Report {report_id} is being analyzed...")
+    else:
+        st.session_state["upload_report"] = report
+        fetch_reports.clear()
+        st.rerun()
+
+def show_insights(report):
+    """
+    Render a report's AI insights, or its analysis status when they are not available.
+    """
+    if report["status"] == "failed":
+        st.error("The analysis of this report failed")
+    elif report["status"] != "done":
+        st.info("This report is still being analyzed; check back shortly")
+    else:
+        st.metric("Insight score", report["insight_score"])
+        try:
+            st.json(json.loads(report["summary_text"]))
+        except (TypeError, ValueError):
+            st.write(report["summary_text"])
+
 st.set_page_config(page_title="AI Report Analyzer", layout="wide")
 
 st.title("Intelligent Business Report Analyzer")
 
 uploaded_file = st.file_uploader("Choose a CSV file", type="csv")
 
-if uploaded_file is not None:
-    with st.spinner("Processing data..."):
-        files = {"file": uploaded_file.getvalue()}
+# Streamlit reruns this script on every widget change while the uploader keeps its
+# file, so each upload is posted once and remembered by its file_id.
+if uploaded_file is not None and st.session_state.get("upload_file_id") != uploaded_file.file_id:
+    st.session_state["upload_file_id"] = uploaded_file.file_id
+    st.session_state["upload_report"] = None
+    with st.spinner("Uploading data..."):
+        files = {"file": (uploaded_file.name, uploaded_file, uploaded_file.type or "text/csv")}
         try:
-            response = requests.post(f"{API_URL}/upload", files=files)
-            if response.status_code == 200:
-                data = response.json()
-                st.success("Report Analyzed Successfully")
-                st.json(data["insights"])
+            response = _session().post(f"{API_URL}/upload", files=files)
+            if response.status_code == 202:
+                st.session_state["upload_report"] = {"id": response.json()["report_id"], "status": "pending"}
+                fetch_reports.clear()
             else:
                 st.error("Failed to process report")
         except Exception as e:
             st.error(f"Connection error: {str(e)}")
 
+upload_report = st.session_state.get("upload_report") if uploaded_file is not None else None
+if upload_report is not None:
+    if upload_report["status"] == "pending":
+        await_report(upload_report["id"])
+    else:
+        if upload_report["status"] == "done":
+            st.success("Report Analyzed Successfully")
+        show_insights(upload_report)
+
 st.divider()
 
 st.subheader("Historical Reports")
 
 try:
-    resp = requests.get(f"{API_URL}/reports")
-    if resp.status_code == 200:
-        reports = resp.json()
-        if reports:
-            df_reports = pd.DataFrame(reports)
-            st.dataframe(df_reports)
-        else:
-            st.info("No reports found")
+    reports = fetch_reports()
+    if reports.num_rows:
+        st.dataframe(reports, use_container_width=True)
+        selected = st.selectbox("Show insights for report", reports["id"].to_pylist())
+        if selected is not None:
+            show_insights(fetch_report(selected))
+    else:
+        st.info("No reports found")
 except:
     st.info("Waiting for API service")
\ No newline at end of file
@@ -1,30 +1,90 @@
-from sqlalchemy import create_engine
+from sqlalchemy.engine import make_url
+from sqlalchemy.ext.asyncio import async_sessionmaker, create_async_engine
 from sqlalchemy.ext.declarative import declarative_base
-from sqlalchemy.orm import sessionmaker
+from sqlalchemy.pool import StaticPool
 from app.config.settings import settings
 
-engine = create_engine(settings.DATABASE_URL)
+
+def _async_url(database_url):
+    """
+    Rewrite a plain PostgreSQL or SQLite connection string to use an asyncio driver.
+
+    Deployments configure DATABASE_URL as 'postgresql://...', which SQLAlchemy maps to
+    the blocking psycopg2 driver, and local development and tests use 'sqlite:///...',
+    which maps to the blocking pysqlite driver. The async engine needs an
+    asyncio-capable driver, so the default and psycopg2 PostgreSQL drivers are swapped
+    for asyncpg and the default SQLite driver for aiosqlite. URLs that already name a
+    driver for another backend are returned unchanged.
+
+    Args:
+        database_url (str): Database connection string from the application settings.
+
+    Returns:
+        str: Connection string suitable for create_async_engine.
+    """
+    url = make_url(database_url)
+    if url.drivername in ("postgresql", "postgresql+psycopg2"):
+        url = url.set(drivername="postgresql+asyncpg")
+    elif url.drivername in ("sqlite", "sqlite+pysqlite"):
+        url = url.set(drivername="sqlite+aiosqlite")
+    return url.render_as_string(hide_password=False)
+
+
+def _engine_options(database_url):
+    """
+    Build the keyword arguments used to create the database engine for a given URL.
+
+    SQLite does not benefit from a connection pool and refuses to share connections
+    across threads by default, so it gets a single static connection with the thread
+    check disabled. Every other backend gets an explicitly sized QueuePool so that
+    concurrent requests do not exhaust the small library defaults, with pre-ping and
+    periodic recycling to survive connections dropped by the server or a proxy.
+
+    Args:
+        database_url (str): Database connection string from the application settings.
+
+    Returns:
+        dict: Keyword arguments suitable for passing to create_async_engine.
+    """
+    if make_url(database_url).get_backend_name() == "sqlite":
+        return {
+            "poolclass": StaticPool,
+            "connect_args": {"check_same_thread": False},
+        }
+    return {
+        "pool_size": settings.DB_POOL_SIZE,
+        "max_overflow": settings.DB_MAX_OVERFLOW,
+        "pool_pre_ping": True,
+        "pool_recycle": 3600,
+        "pool_timeout": 30,
+    }
+
+
+engine = create_async_engine(_async_url(settings.DATABASE_URL), **_engine_options(settings.DATABASE_URL))
 """
-    SQLAlchemy database engine instance configured with the application's database URL.
-    
+    SQLAlchemy asynchronous database engine instance configured with the application's database URL.
+
     This engine serves as the central connection factory for the application's database
     interactions. It manages connection pooling, SQL statement execution, and database
-    communication protocols. The engine is initialized with the database URL from the
-    application settings and handles all low-level database operations while maintaining
-    efficient connection reuse through built-in pooling mechanisms.
+    communication protocols without blocking the event loop. The engine is initialized
+    with the database URL from the application settings and handles all low-level
+    database operations while maintaining efficient connection reuse through an
+    explicitly sized pool (see DB_POOL_SIZE and DB_MAX_OVERFLOW in the settings).
 """
 
-SessionLocal = sessionmaker(
-    autocommit=False,
+SessionLocal = async_sessionmaker(
+    engine,
     autoflush=False,
-    bind=engine
+    expire_on_commit=False
 )
 """
-SQLAlchemy session factory configured for transactional database operations.
+SQLAlchemy async session factory configured for transactional database operations.
 
-This session factory creates database sessions that are bound to the application's
-configured database engine. It's configured with autocommit=False and autoflush=False
-to provide explicit control over transaction boundaries and database synchronization.
+This session factory creates AsyncSession instances that are bound to the application's
+configured async engine. It's configured with autoflush=False to provide explicit control
+over database synchronization, and with expire_on_commit=False so that objects remain
+readable after a commit without triggering an implicit (and, under asyncio, illegal)
+lazy refresh.
 Each session created from this factory maintains its own transaction state and can
 be used for multiple related database operations before committing or rolling back
 the entire transaction.
@@ -50,42 +110,34 @@ during application startup.
 """
 
 
-def get_db():
+async def get_db():
     """
-    Generator function that provides database sessions for dependency injection.
+    Async generator that provides database sessions for dependency injection.
 
-    This generator creates a new database session from the SessionLocal factory and yields
-    it to the caller, ensuring proper session lifecycle management through context handling.
-    The function implements a try-finally pattern to guarantee that database sessions are
-    always closed after use, preventing connection leaks and resource exhaustion. This
-    pattern is commonly used in FastAPI applications for dependency injection of database
-    sessions into route handlers.
+    This generator creates a new AsyncSession from the SessionLocal factory and yields
+    it to the caller, ensuring proper session lifecycle management through an async
+    context manager. The session is always closed when the request finishes, returning
+    its connection to the pool and preventing connection leaks and resource exhaustion.
+    This pattern is commonly used in FastAPI applications for dependency injection of
+    database sessions into route handlers.
 
-    The yielded session supports full SQLAlchemy ORM functionality including querying,
-    object persistence, and transaction management. The automatic cleanup ensures that
-    connections are returned to the pool efficiently, maintaining optimal database
-    connection utilization across the application.
+    All database round-trips made through the yielded session are awaited, so the event
+    loop keeps serving other requests while a query is in flight instead of blocking on
+    the socket.
 
     Yields:
-        Session: A SQLAlchemy database session instance configured for transactional
-                operations. The session includes methods for querying, adding, updating,
-                and deleting database records with proper transaction isolation.
+        AsyncSession: A SQLAlchemy async database session instance configured for
+                transactional operations. Queries are issued with await db.execute(...)
+                and changes are persisted with await db.commit().
 
     Example:
         # In a FastAPI route handler using dependency injection
         from fastapi import Depends
-        
-        def my_route(db: Session = Depends(get_db)):
-            user = db.query(User).filter(User.id == 1).first()
-            return user
-            
-        # Manual usage (though dependency injection is preferred)
-        for db_session in get_db():
-            users = db_session.query(User).all()
-            break  # Important: exit generator to trigger cleanup
+        from sqlalchemy import select
+
+        async def my_route(db: AsyncSession = Depends(get_db)):
+            result = await db.execute(select(User).where(User.id == 1))
+            return result.scalars().first()
     """
-    db = SessionLocal()
-    try:
+    async with SessionLocal() as db:
         yield db
-    finally:
-        db.close()
\ No newline at end of file
@@ -1,7 +1,14 @@
-from sqlalchemy import Column, Integer, String, Text, DateTime, Float
-from sqlalchemy.sql import func
+import time
+from sqlalchemy import Column, Integer, BigInteger, String, Text, Float, ForeignKey, Index
+from sqlalchemy.orm import relationship
 from app.database.connection import Base
 
+def _now_ms():
+    """
+    Return the current time as integer milliseconds since the Unix epoch (UTC).
+    """
+    return int(time.time() * 1000)
+
 class Report(Base):
     """
     Database model representing a processed report with metadata and analytical results.
@@ -32,7 +39,7 @@ class Report(Base):
     
     This specifies the physical table name in the database where Report instances are stored.
     The table contains columns for ID, filename, upload date, row count, summary text,
-    and insight scores for processed reports.
+    insight score, and processing status for uploaded reports.
     """
 
     id = Column(Integer, primary_key=True, index=True)
@@ -45,25 +52,38 @@ class Report(Base):
     managed by the database and should not be set manually when creating new records.
     """
 
-    filename = Column(String, index=True)
+    filename = Column(String)
     """
     Original filename of the uploaded report document.
     
     This string field stores the original name of the file that was uploaded and
-    processed to create this report record. The indexed property allows for efficient
-    searching and filtering by filename. This field is useful for identifying and
+    processed to create this report record. This field is useful for identifying and
     referencing specific report files in the user interface and for audit purposes.
+    It is not indexed, since no query filters on it and every index adds work to
+    each insert.
     """
 
-    upload_date = Column(DateTime(timezone=True), server_default=func.now())
+    upload_date = Column(BigInteger, default=_now_ms)
     """
-    Timestamp indicating when the report was uploaded and initially processed.
-    
-    This datetime field automatically captures the precise moment when the report
-    was first created in the system. The timezone-aware setting ensures accurate
-    time representation across different geographical locations. The server_default
-    with func.now() ensures the timestamp is set by the database server rather than
-    the application, providing more reliable and consistent timing information.
+    Timestamp indicating when the report was uploaded, in milliseconds since the Unix epoch (UTC).
+
+    This field automatically captures the moment when the report was first created
+    in the system. It is stored as a plain integer rather than a timestamp type
+    because it is written once and then read and sorted on every report listing:
+    integers are returned by the driver as-is, whereas timestamp columns are turned
+    into Python datetime objects row by row. Clients convert it for display, e.g.
+    with pd.to_datetime(values, unit="ms", utc=True).
+    """
+
+    __table_args__ = (
+        Index("ix_reports_upload_date", upload_date.desc()),
+    )
+    """
+    Descending index on upload_date backing the newest-first report listing.
+
+    The /reports endpoint orders by upload_date DESC with a LIMIT, which this index
+    lets the database answer by reading the first entries of the index instead of
+    sorting the whole table on every request.
     """
 
     total_rows = Column(Integer)
@@ -98,6 +118,31 @@ class Report(Base):
     filtering reports based on their analytical value.
     """
 
+    status = Column(String, default="pending")
+    """
+    Processing state of the report's AI analysis.
+
+    Reports are created as "pending" when an upload is accepted and move to "done"
+    once the background analysis has stored the summary and score, or to "failed"
+    if the analysis could not be completed. summary_text and insight_score are only
+    populated for reports whose status is "done".
+    """
+
+    metrics = relationship(
+        "Metric",
+        back_populates="report",
+        lazy="selectin",
+        passive_deletes=True
+    )
+    """
+    Metrics extracted from this report.
+
+    Loaded eagerly with a single additional SELECT ... WHERE report_id IN (...) query per
+    batch of reports (selectin loading), rather than one query per report. Deleting a
+    report relies on the database's ON DELETE CASCADE to remove its metrics instead of
+    loading and deleting them one by one in the application.
+    """
+
 class Metric(Base):
     """
     Database model representing individual metrics extracted from processed reports.
@@ -134,6 +179,16 @@ class Metric(Base):
     The table contains columns for ID, report reference, metric name, and metric value.
     """
 
+    __table_args__ = (
+        Index("ix_metric_report_name", "report_id", "metric_name"),
+    )
+    """
+    Composite index serving lookups of a named metric within a report.
+
+    Queries such as "metric Y of report X" are answered with a single B-tree seek on
+    (report_id, metric_name) instead of scanning every metric of the report.
+    """
+
     id = Column(Integer, primary_key=True, index=True)
     """
     Unique identifier for the metric record.
@@ -144,15 +199,14 @@ class Metric(Base):
     managed by the database and should not be set manually when creating new records.
     """
 
-    report_id = Column(Integer, index=True)
+    report_id = Column(Integer, ForeignKey("reports.id", ondelete="CASCADE"), index=True, nullable=False)
     """
     Foreign key reference to the associated report record.
     
     This integer field links the metric to its parent report by storing the ID of
     the corresponding Report record. The indexed property enables efficient queries
-    to find all metrics associated with a particular report. While this doesn't
-    enforce foreign key constraints at the SQLAlchemy level, it establishes the
-    logical relationship between metrics and reports for data organization.
+    to find all metrics associated with a particular report. The foreign key is
+    enforced by the database, and deleting a report cascades to its metrics.
     """
 
     metric_name = Column(String)
@@ -175,4 +229,9 @@ class Metric(Base):
     monetary amounts, ratios, or other numerical data extracted from reports.
     The float type accommodates both integer and decimal values, providing precision
     for financial calculations, percentages, and other detailed measurements.
+    """
+
+    report = relationship("Report", back_populates="metrics")
+    """
+    The Report this metric was extracted from.
     """
\ No newline at end of file
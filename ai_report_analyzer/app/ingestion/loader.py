@@ -1,5 +1,99 @@
 import pandas as pd
+import pyarrow as pa
+import pyarrow.csv as pacsv
 import io
+import threading
+from collections import OrderedDict
+
+_ARROW_READ_OPTIONS = pacsv.ReadOptions(use_threads=True, block_size=1 << 20)
+
+_SCHEMA_CACHE_SIZE = 256
+_schema_cache = OrderedDict()
+"""
+Column types inferred for recently uploaded filenames, most recently used last.
+
+Reports are typically re-uploaded under the same name with the same layout (for
+example a monthly export), so the types inferred for one upload are passed to the
+parser for the next one with that name, skipping type inference. Only numeric,
+boolean and temporal types are remembered: a value that does not fit them makes the
+parser fail, so a stale entry is detected and discarded. Text and all-null columns
+are left to inference, since pinning them to string would silently accept a later
+file whose column is numeric. Bounded to the _SCHEMA_CACHE_SIZE most recently used
+filenames. Guarded by _schema_cache_lock, as uploads are parsed in worker threads.
+"""
+
+_schema_cache_lock = threading.Lock()
+
+class UploadTooLargeError(ValueError):
+    """
+    Raised when an upload exceeds the configured size limits.
+
+    A ValueError subclass, so existing handlers for invalid input keep catching it,
+    while the API can tell it apart to answer with 413 Payload Too Large.
+    """
+
+def _cached_column_types(filename):
+    """
+    Return the column types remembered for a filename, or None if there are none.
+
+    Marks the entry as the most recently used one.
+    """
+    if filename is None:
+        return None
+    with _schema_cache_lock:
+        if filename not in _schema_cache:
+            return None
+        _schema_cache.move_to_end(filename)
+        return _schema_cache[filename]
+
+def _is_strict_type(arrow_type):
+    """
+    Return whether an inferred Arrow type is safe to pin for later uploads.
+
+    Numeric, boolean and temporal types reject values that do not fit them, so a
+    stale pin makes the parse fail instead of silently changing the result.
+    """
+    return (
+        pa.types.is_integer(arrow_type)
+        or pa.types.is_floating(arrow_type)
+        or pa.types.is_boolean(arrow_type)
+        or pa.types.is_temporal(arrow_type)
+    )
+
+def _remember_column_types(filename, schema):
+    """
+    Remember the strict column types of a parsed file's schema under its filename.
+
+    Evicts the least recently used entry once the cache holds more than
+    _SCHEMA_CACHE_SIZE filenames.
+    """
+    column_types = {name: t for name, t in zip(schema.names, schema.types) if _is_strict_type(t)}
+    with _schema_cache_lock:
+        _schema_cache[filename] = column_types
+        _schema_cache.move_to_end(filename)
+        if len(_schema_cache) > _SCHEMA_CACHE_SIZE:
+            _schema_cache.popitem(last=False)
+
+def _forget_column_types(filename):
+    """
+    Discard the column types remembered for a filename, if any.
+    """
+    with _schema_cache_lock:
+        _schema_cache.pop(filename, None)
+
+def _read_arrow_csv(fileobj, column_types):
+    """
+    Parse a binary CSV file object into an Arrow table with PyArrow's threaded reader.
+
+    Columns named in column_types are converted to the given types instead of being
+    inferred. Raises pyarrow.ArrowInvalid for input the reader rejects.
+    """
+    convert_options = pacsv.ConvertOptions(column_types=column_types) if column_types else None
+    return pacsv.read_csv(
+        pa.PythonFile(fileobj, mode="r"),
+        read_options=_ARROW_READ_OPTIONS,
+        convert_options=convert_options
+    )
 
 def load_csv_from_bytes(file_bytes):
     """
@@ -45,12 +139,78 @@ def load_csv_from_bytes(file_bytes):
         df = load_csv_from_bytes(uploaded_file_bytes)
         print(df.head())
     """
-    df = pd.read_csv(io.BytesIO(file_bytes))
-    return df
+    return load_csv_stream(io.BytesIO(file_bytes))
 
-def validate_dataframe(df):
+def load_csv_stream(fileobj, filename=None):
     """
-    Validate that a pandas DataFrame contains meaningful data.
+    Load CSV data from a binary file-like object into a pandas DataFrame.
+
+    Unlike load_csv_from_bytes, this reads straight from an open file handle, so the
+    caller never has to materialize the whole upload as a bytes object first. This is
+    the preferred entry point for FastAPI uploads, whose UploadFile.file attribute is a
+    SpooledTemporaryFile that is already spilled to disk for large files; handing it to
+    the parser directly (PyArrow's CSV reader, through a pyarrow.PythonFile wrapper,
+    with pandas only as a fallback) keeps peak memory to the parsed data rather than
+    the raw bytes plus a BytesIO copy plus the DataFrame.
+
+    Parsing is done by PyArrow's multi-threaded CSV reader, which splits the input into
+    1 MiB blocks and converts them in parallel in C++. The resulting Arrow table is
+    exposed to pandas with Arrow-backed dtypes (pd.ArrowDtype), so the columns are
+    wrapped rather than copied into NumPy arrays. Inputs PyArrow rejects (for example
+    ragged rows that pandas tolerates) fall back to pandas' own C parser with
+    low_memory=False and Arrow-backed dtypes, so the set of accepted files is
+    unchanged and the result has the same kind of columns either way.
+
+    When a filename is given, the numeric, boolean and temporal column types inferred
+    for it are remembered and passed to the parser the next time a file with that
+    name is loaded, so repeat uploads of the same report skip most type inference.
+    If a file no longer parses with the remembered types, they are discarded and the
+    file is parsed again with inference. Text columns are always inferred afresh, so
+    an earlier upload with the same name never turns a numeric column into text.
+
+    Reading and parsing are blocking, CPU-bound work, so async callers should run
+    this in a worker thread (e.g. with asyncio.to_thread) rather than on the event loop.
+
+    Args:
+        fileobj (BinaryIO): Readable, seekable binary file-like object positioned at
+                the start of CSV-formatted content.
+
+        filename (str, optional): Name of the uploaded file, used as the key for
+                remembering its column types. Defaults to None (no caching).
+
+    Returns:
+        pandas.DataFrame: A DataFrame containing the parsed CSV data, backed by Arrow
+                arrays when PyArrow was able to parse the input.
+
+    Raises:
+        pandas.errors.EmptyDataError: If the CSV content is empty or contains no data
+        UnicodeDecodeError: If the content cannot be decoded as valid text
+        pandas.errors.ParserError: If the CSV format is invalid or malformed
+
+    Example:
+        # Parsing a FastAPI upload without reading it into memory first
+        df = load_csv_stream(upload.file, upload.filename)
+
+        # Parsing a file on disk
+        with open('data.csv', 'rb') as f:
+            df = load_csv_stream(f)
+    """
+    column_types = _cached_column_types(filename)
+    try:
+        table = _read_arrow_csv(fileobj, column_types)
+    except pa.ArrowInvalid:
+        fileobj.seek(0)
+        if column_types is None:
+            return pd.read_csv(fileobj, engine="c", low_memory=False, dtype_backend="pyarrow")
+        _forget_column_types(filename)
+        return load_csv_stream(fileobj, filename)
+    if filename is not None:
+        _remember_column_types(filename, table.schema)
+    return table.to_pandas(types_mapper=pd.ArrowDtype)
+
+def validate_dataframe(df, max_rows=None):
+    """
+    Validate that a pandas DataFrame contains meaningful data of a manageable size.
 
     This function performs basic validation checks on a DataFrame to ensure it
     contains actual data before proceeding with further processing or analysis.
@@ -62,8 +222,25 @@ def validate_dataframe(df):
     The function serves as a gatekeeper in data processing workflows, ensuring
     that subsequent operations receive valid input. It's commonly used after
     data loading operations to confirm successful data extraction and before
-    analysis or transformation steps that require
+    analysis or transformation steps that require non-empty input. When max_rows
+    is given it also rejects oversized inputs, so they are turned away before the
+    comparatively expensive aggregation and AI analysis are attempted.
+
+    Args:
+        df (pandas.DataFrame): The DataFrame to validate.
+
+        max_rows (int, optional): Maximum number of rows accepted. Defaults to None
+                (no limit).
+
+    Returns:
+        bool: True if the DataFrame passed validation.
+
+    Raises:
+        ValueError: If the DataFrame is empty.
+        UploadTooLargeError: If the DataFrame has more than max_rows rows.
     """
     if df.empty:
         raise ValueError("Empty dataframe")
-    return True
\ No newline at end of file
+    if max_rows is not None and len(df) > max_rows:
+        raise UploadTooLargeError(f"File has {len(df)} rows; at most {max_rows} are accepted")
+    return True
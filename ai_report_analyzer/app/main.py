@@ -1,155 +1,315 @@
-from fastapi import FastAPI, UploadFile, File, Depends, HTTPException
-from sqlalchemy.orm import Session
-from app.database.connection import get_db, Base, engine
+from contextlib import asynccontextmanager
+from fastapi import FastAPI, UploadFile, File, Depends, HTTPException, Query, BackgroundTasks
+from sqlalchemy import insert, select, update
+from sqlalchemy.ext.asyncio import AsyncSession
+from app.config.settings import settings
+from app.database.connection import get_db, Base, engine, SessionLocal
 from app.database.models import Report, Metric
-from app.ingestion.loader import load_csv_from_bytes, validate_dataframe
-from app.processing.aggregator import aggregate_data, prepare_context_for_ai
+from app.ingestion.loader import load_csv_stream, validate_dataframe, UploadTooLargeError
+from app.processing.aggregator import build_report
 from app.ai_integration.gemini_client import generate_insights
-import json
+import asyncio
+import logging
+import numpy as np
+import orjson
 
-Base.metadata.create_all(bind=engine)
+logger = logging.getLogger(__name__)
 
-app = FastAPI()
+@asynccontextmanager
+async def lifespan(app):
+    """
+    Optionally create missing database tables on startup and dispose of the engine on shutdown.
+
+    The schema is normally managed with Alembic migrations applied once per deploy;
+    table creation here only runs when AUTO_CREATE_TABLES is enabled, for local
+    development. It goes through the async engine's run_sync bridge so that schema
+    introspection does not block the event loop, and disposing of the engine on
+    shutdown closes every pooled connection cleanly.
+    """
+    if settings.AUTO_CREATE_TABLES:
+        async with engine.begin() as conn:
+            await conn.run_sync(Base.metadata.create_all)
+    yield
+    await engine.dispose()
+
+app = FastAPI(lifespan=lifespan)
+
+def _metric_rows(report_id, stats):
+    """
+    Flatten aggregate_data output into parameter rows for a bulk Metric insert.
+
+    Each (column, statistic) pair becomes one metric named "<column>_<statistic>", e.g.
+    "revenue_mean". Missing values (all-null columns) are stored as NULL.
+
+    Args:
+        report_id (int): Primary key of the report the metrics belong to.
+        stats (StatsTable): Columnar statistics as returned by aggregate_data.
+
+    Returns:
+        list: One dict per metric with report_id, metric_name and metric_value keys.
+    """
+    return [
+        {
+            "report_id": report_id,
+            "metric_name": f"{col}_{stat}",
+            "metric_value": None if np.isnan(value) else value
+        }
+        for stat in ("mean", "sum", "min", "max")
+        for col, value in zip(stats.columns, getattr(stats, stat).tolist())
+    ]
+
+async def _store_results(report_id, values, rows):
+    """
+    Update a report's row and insert its Metric rows in one transaction.
+    """
+    async with SessionLocal() as db:
+        await db.execute(update(Report).where(Report.id == report_id).values(**values))
+        if rows:
+            await db.execute(insert(Metric), rows)
+        await db.commit()
 
-@app.post("/upload")
-async def upload_report(file: UploadFile = File(...), db: Session = Depends(get_db)):
+async def run_ai_pipeline(report_id, df):
     """
-    Upload and process a CSV report file, generating AI-powered insights.
-
-    This endpoint accepts CSV file uploads and processes them through a complete
-    data pipeline including validation, statistical analysis, and AI-powered
-    insight generation. The function orchestrates the entire workflow from file
-    ingestion to database persistence, creating a comprehensive report record
-    with analytical results. It handles both the core data processing and the
-    storage of results in the application database.
-
-    The processing pipeline includes data loading and validation, statistical
-    aggregation, AI context preparation, insight generation using Google's
-    Gemini model, and database persistence of results. Error handling ensures
-    that any issues during the processing pipeline are caught and reported
-    appropriately, while successful processing results in a persistent report
-    record that can be retrieved later.
+    Analyze an uploaded report with Gemini and record the results on its database row.
+
+    Runs as a FastAPI background task after /upload has responded. It aggregates the
+    numeric columns, asks Gemini for insights, and then updates the pending report with
+    the summary, the score and a final status of "done", storing the per-column
+    statistics as Metric rows in the same transaction. The aggregation and the
+    formatting of the AI context (see build_report) are CPU-bound and the Gemini call
+    is a blocking network request, so both run in worker threads to keep the event
+    loop free to serve other requests meanwhile. Any failure, including one while
+    storing the results, marks the report "failed" instead of leaving it pending
+    forever.
+
+    Args:
+        report_id (int): Primary key of the pending report created by /upload.
+        df (pandas.DataFrame): The validated upload to analyze.
+    """
+    try:
+        stats, context = await asyncio.to_thread(build_report, df)
+        ai_response = await asyncio.to_thread(generate_insights, context)
+
+        try:
+            insights_json = orjson.loads(ai_response)
+            summary_text = orjson.dumps(insights_json).decode()
+            score = float(insights_json.get("overall_score", 0.0))
+        except (ValueError, TypeError, AttributeError):
+            # Not JSON (orjson.JSONDecodeError is a ValueError), not a JSON object,
+            # or a score that is not a number: keep the raw text and a neutral score.
+            summary_text = ai_response
+            score = 50.0
+
+        values = {"summary_text": summary_text, "insight_score": score, "status": "done"}
+        rows = _metric_rows(report_id, stats)
+    except Exception:
+        logger.exception("AI analysis failed for report %s", report_id)
+        values = {"status": "failed"}
+        rows = []
+
+    try:
+        await _store_results(report_id, values, rows)
+    except Exception:
+        logger.exception("Storing the analysis failed for report %s", report_id)
+        try:
+            await _store_results(report_id, {"status": "failed"}, [])
+        except Exception:
+            logger.exception("Could not mark report %s as failed", report_id)
+
+@app.post("/upload", status_code=202)
+async def upload_report(
+    background_tasks: BackgroundTasks,
+    file: UploadFile = File(...),
+    db: AsyncSession = Depends(get_db)
+):
+    """
+    Upload a CSV report file and queue it for AI-powered analysis.
+
+    This endpoint accepts CSV file uploads, parses and validates them, and records a
+    report with status "pending" before responding with 202 Accepted. Statistical
+    aggregation, insight generation with Google's Gemini model, and storage of the
+    results happen afterwards in a background task (see run_ai_pipeline), so the
+    request returns in the time it takes to parse the file rather than waiting
+    seconds for the AI service. Parsing reads the uploaded file and runs in a worker
+    thread, so the event loop keeps serving other requests while a large file is read.
+
+    Clients follow the outcome through the report's status, which becomes "done"
+    once insights are stored or "failed" if the analysis could not be completed;
+    GET /reports/{report_id} returns the report with its insights.
 
     Args:
+        background_tasks (BackgroundTasks): FastAPI task queue used to schedule the
+                analysis after the response has been sent.
+
         file (UploadFile): CSV file uploaded by the client. The file must contain
                 valid CSV-formatted data with appropriate headers and
-                structure. The file size should be within reasonable
-                limits to prevent memory issues during processing.
+                structure, and stay within the MAX_UPLOAD_BYTES and
+                MAX_UPLOAD_ROWS limits from the settings.
 
-        db (Session): SQLAlchemy database session dependency injected by FastAPI.
-                Provides access to the database for persisting report and
-                metric records. The session is managed by the dependency
-                injection system and automatically closed after the request.
+        db (AsyncSession): SQLAlchemy async session dependency injected by FastAPI.
+                Provides access to the database for creating the pending report
+                record. The session is managed by the dependency injection system
+                and automatically closed after the request.
 
     Returns:
-        dict: Success response containing:
-            - "status": Always "success" for successful processing
+        dict: Accepted response containing:
+            - "status": Always "pending" for an accepted upload
             - "report_id": Unique identifier of the created report in the database
-            - "insights": AI-generated insights as a string (JSON format if parsing succeeds)
 
     Raises:
-        HTTPException: With status code 500 if any error occurs during the
-                processing pipeline, including file reading, data validation,
-                AI processing failures, or database operations. The exception
+        HTTPException: With status code 413 if the file is larger than
+                MAX_UPLOAD_BYTES (checked before parsing) or has more than
+                MAX_UPLOAD_ROWS rows (checked right after parsing).
+                With status code 500 if the file cannot be read, parsed or
+                validated, or if the report record cannot be created. The exception
                 details contain the underlying error message for debugging.
 
     Example:
         # Using curl to upload a CSV file
         curl -X POST -F "file=@report.csv" http://localhost:8000/upload
-        
-        # Expected response on success:
+
+        # Expected response (HTTP 202):
         {
-            "status": "success",
-            "report_id": 123,
-            "insights": "{\\"insight_1\\": \\"Revenue increased 15%...\\", ...}"
+            "status": "pending",
+            "report_id": 123
         }
     """
+    if file.size is not None and file.size > settings.MAX_UPLOAD_BYTES:
+        raise HTTPException(
+            status_code=413,
+            detail=f"File is {file.size} bytes; at most {settings.MAX_UPLOAD_BYTES} are accepted"
+        )
+
     try:
-        contents = await file.read()
-        df = load_csv_from_bytes(contents)
-        validate_dataframe(df)
-        
-        stats = aggregate_data(df)
-        context = prepare_context_for_ai(df, stats)
-        ai_response = generate_insights(context)
-        
-        try:
-            insights_json = json.loads(ai_response)
-            summary_text = str(insights_json)
-            score = insights_json.get("overall_score", 0.0)
-        except:
-            summary_text = ai_response
-            score = 50.0
-            
+        df = await asyncio.to_thread(load_csv_stream, file.file, file.filename)
+        validate_dataframe(df, max_rows=settings.MAX_UPLOAD_ROWS)
+
         new_report = Report(
             filename=file.filename,
             total_rows=len(df),
-            summary_text=summary_text,
-            insight_score=score
+            status="pending"
         )
-        
+
         db.add(new_report)
-        db.commit()
-        db.refresh(new_report)
-        
-        return {"status": "success", "report_id": new_report.id, "insights": summary_text}
-    
+        await db.commit()
+    except UploadTooLargeError as e:
+        raise HTTPException(status_code=413, detail=str(e))
     except Exception as e:
         raise HTTPException(status_code=500, detail=str(e))
 
+    background_tasks.add_task(run_ai_pipeline, new_report.id, df)
+    return {"status": "pending", "report_id": new_report.id}
+
+@app.get("/reports/{report_id}")
+async def get_report(report_id: int, db: AsyncSession = Depends(get_db)):
+    """
+    Retrieve a single report, including its AI-generated summary.
+
+    Used to follow an upload accepted by /upload: while the analysis is running the
+    report's status is "pending" and summary_text is null; once it completes the
+    status is "done" and summary_text and insight_score are filled in.
+
+    Args:
+        report_id (int): Identifier returned by /upload.
+
+        db (AsyncSession): SQLAlchemy async session dependency injected by FastAPI.
+
+    Returns:
+        dict: The report's id, filename, upload_date, total_rows, summary_text,
+                insight_score and status.
+
+    Raises:
+        HTTPException: With status code 404 if no report has the given id.
+    """
+    stmt = select(
+        Report.id,
+        Report.filename,
+        Report.upload_date,
+        Report.total_rows,
+        Report.summary_text,
+        Report.insight_score,
+        Report.status
+    ).where(Report.id == report_id)
+    row = (await db.execute(stmt)).first()
+    if row is None:
+        raise HTTPException(status_code=404, detail="Report not found")
+    return dict(row._mapping)
+
 @app.get("/reports")
-async def get_reports(db: Session = Depends(get_db)):
+async def get_reports(
+    limit: int = Query(50, ge=1, le=500),
+    offset: int = Query(0, ge=0),
+    db: AsyncSession = Depends(get_db)
+):
     """
-    Retrieve all processed reports from the database.
+    Retrieve a page of processed reports from the database, newest first.
 
-    This endpoint fetches all report records that have been successfully processed
-    and stored in the database through previous upload operations. It provides a
-    comprehensive view of all available reports with their metadata and analytical
-    results. The function serves as a retrieval mechanism for accessing historical
-    analysis results and reviewing previously processed data.
+    This endpoint fetches report records that have been successfully processed and
+    stored in the database through previous upload operations. It provides a listing
+    of available reports with their metadata and scores, serving as the retrieval
+    mechanism behind the dashboard's report history.
 
-    The endpoint returns complete report objects including filenames, upload dates,
-    row counts, summary texts, and insight scores. This information enables clients
-    to browse, filter, and analyze the collection of processed reports. The operation
-    performs a simple SELECT query on the reports table and returns all matching
-    records without additional filtering or pagination.
+    Only the columns needed for a listing are selected: the potentially large
+    summary_text column is deliberately left out, so the amount of data read from the
+    database, serialized to JSON, and sent over the wire is bounded by the page size
+    rather than by the size of the accumulated summaries. Results are ordered by
+    upload date (most recent first), with the report id breaking ties between uploads
+    made in the same millisecond so that pages are stable, and paginated with
+    limit/offset.
 
     Args:
-        db (Session): SQLAlchemy database session dependency injected by FastAPI.
+        limit (int): Maximum number of reports to return, between 1 and 500.
+                Defaults to 50.
+
+        offset (int): Number of reports to skip before the returned page starts.
+                Defaults to 0.
+
+        db (AsyncSession): SQLAlchemy async session dependency injected by FastAPI.
                 Provides access to the database for querying report records.
                 The session is managed by the dependency injection system and
                 automatically closed after the request completes.
 
     Returns:
-        list: List of Report objects containing all processed reports in the database.
-                Each Report object includes properties such as id, filename, upload_date,
-                total_rows, summary_text, and insight_score. The returned list contains
-                complete report data suitable for display in user interfaces or further
-                processing by client applications.
+        list: List of dictionaries, one per report, with the keys id, filename,
+                upload_date (milliseconds since the Unix epoch), total_rows,
+                insight_score and status.
 
     Example:
-        # Request to get all reports
-        GET http://localhost:8000/reports
-        
+        # Request the first page of reports
+        GET http://localhost:8000/reports?limit=50&offset=0
+
         # Expected response:
         [
+            {
+                "id": 2,
+                "filename": "inventory_data.csv",
+                "upload_date": 1705396500000,
+                "total_rows": 850,
+                "insight_score": 78.0,
+                "status": "done"
+            },
             {
                 "id": 1,
                 "filename": "sales_report.csv",
-                "upload_date": "2024-01-15T10:30:00Z",
+                "upload_date": 1705314600000,
                 "total_rows": 1500,
-                "summary_text": "{\\"insight_1\\": \\"Sales up 15%...\\", ...}",
-                "insight_score": 92.5
-            },
-            {
-                "id": 2,
-                "filename": "inventory_data.csv", 
-                "upload_date": "2024-01-16T09:15:00Z",
-                "total_rows": 850,
-                "summary_text": "{\\"insight_1\\": \\"Inventory levels stable...\\", ...}",
-                "insight_score": 78.0
+                "insight_score": 92.5,
+                "status": "done"
             }
         ]
     """
-    reports = db.query(Report).all()
-    return reports
\ No newline at end of file
+    stmt = (
+        select(
+            Report.id,
+            Report.filename,
+            Report.upload_date,
+            Report.total_rows,
+            Report.insight_score,
+            Report.status
+        )
+        .order_by(Report.upload_date.desc(), Report.id.desc())
+        .limit(limit)
+        .offset(offset)
+    )
+    result = await db.execute(stmt)
+    return [dict(row._mapping) for row in result]
@@ -1,4 +1,325 @@
-def aggregate_data(df):
+import io
+import os
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass
+from functools import lru_cache
+import numba
+import numpy as np
+import orjson
+import pandas as pd
+import pyarrow as pa
+import pyarrow.compute as pc
+
+_PARALLEL_MIN_ROWS = 100_000
+"""
+Row count from which aggregate_data reduces columns in parallel.
+
+Below this, handing columns to worker threads costs more than the reductions.
+"""
+
+_L2_CACHE_BYTES = 1 << 20
+"""
+Approximate per-core L2 cache size, in bytes, used to size the row tiles of _block_stats.
+
+One tile holds this many bytes across all columns of the block. 1 MiB is a
+conservative figure for current server and desktop CPUs; a smaller cache only means
+tiles spill to L3.
+"""
+
+_MIN_TILE_ROWS = 1024
+"""
+Fewest rows a tile of _block_stats may have; wider blocks are reduced without tiling.
+
+On very wide blocks an L2-sized tile is only a few rows tall, and the per-tile
+Python loop then costs far more than the cache misses it saves.
+"""
+
+@numba.njit(cache=True, nogil=True)
+def _fused_kernel(values):
+    """
+    Compute mean, sum, min and max of a 1-D array in a single pass, skipping NaNs.
+
+    Fusing the four reductions means each element is read from memory once instead
+    of four times. The sum is accumulated in float64 whatever the input dtype. The
+    kernel releases the GIL, so several columns can be reduced concurrently from
+    different threads. fastmath is deliberately not enabled: it lets the compiler
+    assume there are no NaNs, which would break the NaN check.
+
+    Args:
+        values (numpy.ndarray): One-dimensional integer or floating-point array.
+
+    Returns:
+        tuple: (mean, sum, min, max) as floats. For an array with no non-NaN values
+            the sum is 0.0 and the other three are NaN, matching pandas.
+    """
+    count = 0
+    total = 0.0
+    lowest = np.inf
+    highest = -np.inf
+    for i in range(values.shape[0]):
+        value = values[i]
+        if value != value:
+            continue
+        count += 1
+        total += value
+        if value < lowest:
+            lowest = value
+        if value > highest:
+            highest = value
+    if count == 0:
+        return np.nan, 0.0, np.nan, np.nan
+    return total / count, total, float(lowest), float(highest)
+
+def _fused_stats(values):
+    """
+    Run the fused kernel on a 1-D array, widening dtypes Numba cannot compile for.
+
+    Numba has no float16 arithmetic, so float16 arrays are upcast to float32 first;
+    every other integer or floating-point array is passed through unchanged.
+    """
+    if values.dtype == np.float16:
+        values = values.astype(np.float32)
+    return _fused_kernel(values)
+
+def _column_values(series):
+    """
+    Return a numeric Series' values as a NumPy array the fused kernel can consume.
+
+    NumPy-backed columns are returned without copying. Other extension-backed columns
+    (e.g. nullable integer/float) are converted to float64 with missing values as NaN.
+    """
+    if isinstance(series.dtype, np.dtype):
+        return series.to_numpy()
+    return series.to_numpy(dtype=np.float64, na_value=np.nan)
+
+def numeric_view(df):
+    """
+    Return the numeric columns of a DataFrame, ready to pass to aggregate_data.
+
+    Selecting columns by dtype inspects every column of the frame. Callers that
+    aggregate the same DataFrame more than once, or that need its numeric columns for
+    other purposes as well, can call this once and pass the result along instead of
+    having each consumer repeat the selection.
+
+    Args:
+        df (pandas.DataFrame): Input DataFrame.
+
+    Returns:
+        pandas.DataFrame: The integer and floating-point columns of df (NumPy- or
+            extension-backed), in their original order.
+    """
+    return df.select_dtypes(include=["integer", "floating"])
+
+def _arrow_stats(series):
+    """
+    Return (mean, sum, min, max) for an Arrow-backed Series using Arrow compute kernels.
+
+    The loader reads CSVs into Arrow-backed columns, so this is the common case. The
+    Arrow buffers are reduced in place by Arrow's vectorized C++ kernels (min and max
+    together in one call), without first converting the column to a float64 NumPy
+    copy. Nulls are skipped. The mean is derived from the sum and the non-null count,
+    which Arrow keeps in the array's metadata, instead of running a separate mean
+    kernel over the values again. Arrow's integer sums wrap around on overflow, so
+    integer columns are summed as float64 (rounding beyond 2**53), as the NumPy
+    paths do. Arrow propagates NaN through sums, so a float column holding NaN values
+    (rather than nulls) falls back to the NaN-skipping fused kernel.
+    """
+    values = pa.array(series.array)
+    summands = pc.cast(values, pa.float64(), safe=False) if pa.types.is_integer(values.type) else values
+    total = pc.sum(summands, min_count=0).as_py()
+    if total != total:
+        return _fused_stats(_column_values(series))
+    count = len(values) - values.null_count
+    extremes = pc.min_max(values)
+    lowest, highest = extremes["min"].as_py(), extremes["max"].as_py()
+    return (
+        total / count if count else np.nan,
+        float(total),
+        np.nan if lowest is None else float(lowest),
+        np.nan if highest is None else float(highest)
+    )
+
+def _column_stats(series):
+    """
+    Return (mean, sum, min, max) for one numeric Series.
+
+    NumPy-backed columns without missing values (every integer column, and float
+    columns for which hasnans is False) are reduced with NumPy's own SIMD reductions
+    on the underlying array, which need no per-element NaN check. Columns with
+    missing values go through the NaN-skipping fused kernel.
+    """
+    if isinstance(series.array, pd.arrays.ArrowExtensionArray):
+        return _arrow_stats(series)
+    values = _column_values(series)
+    if isinstance(series.dtype, np.dtype) and len(values) and (values.dtype.kind != "f" or not series.hasnans):
+        total = values.sum(dtype=np.float64)
+        return total / len(values), total, float(values.min()), float(values.max())
+    return _fused_stats(values)
+
+def _homogeneous_block(numeric):
+    """
+    Return the numeric columns as one 2-D column-major array when they share a NumPy dtype.
+
+    When every column has the same NumPy dtype, pandas stores them together and can
+    expose them as a single Fortran-ordered (column-major) array without per-column
+    dispatch. Returns None when the dtypes differ, any column is extension-backed, the
+    frame has no rows, or the array would not be column-major (column reductions would
+    then stride across memory).
+    """
+    dtypes = set(numeric.dtypes)
+    if len(dtypes) != 1 or not isinstance(dtypes.pop(), np.dtype) or not len(numeric):
+        return None
+    block = numeric.to_numpy()
+    if not block.flags["F_CONTIGUOUS"]:
+        return None
+    return block
+
+def _block_stats(block):
+    """
+    Return the mean, sum, min and max arrays for the columns of a 2-D column-major array.
+
+    The block is processed in tiles of consecutive rows sized so that one tile of
+    every column fits in L2 cache (see _L2_CACHE_BYTES). The sum, minimum and
+    maximum of each tile are computed with vectorized NumPy reductions along axis 0
+    and folded into running per-column results, so the three reductions re-read a
+    tile from L2 instead of streaming the whole block from main memory three times.
+    When so many columns share the cache that a tile would be shorter than
+    _MIN_TILE_ROWS, the whole block is reduced at once instead. NaN propagates
+    through a column's sum, so columns whose sum comes out NaN are recomputed with
+    the NaN-skipping fused kernel.
+    """
+    rows, width = block.shape
+    tile = _L2_CACHE_BYTES // (width * block.itemsize)
+    if tile < _MIN_TILE_ROWS:
+        tile = rows
+    totals = np.zeros(width)
+    lowest = np.full(width, np.inf)
+    highest = np.full(width, -np.inf)
+    for start in range(0, rows, tile):
+        part = block[start:start + tile]
+        totals += part.sum(axis=0, dtype=np.float64)
+        np.minimum(lowest, part.min(axis=0), out=lowest)
+        np.maximum(highest, part.max(axis=0), out=highest)
+    means = totals / rows
+    for j in np.flatnonzero(np.isnan(totals)):
+        means[j], totals[j], lowest[j], highest[j] = _fused_stats(block[:, j])
+    return means, totals, lowest, highest
+
+_local = threading.local()
+"""
+Per-thread state of this module; holds the buffer prepare_context_for_ai writes into.
+"""
+
+def _context_buffer():
+    """
+    Return this thread's reusable text buffer, emptied and ready to be written.
+
+    The buffer is created on the first call in each thread and reused afterwards, so
+    prepare_context_for_ai can write its pieces straight into one growing buffer
+    instead of building and concatenating intermediate strings.
+    """
+    buf = getattr(_local, "buf", None)
+    if buf is None:
+        buf = _local.buf = io.StringIO()
+    buf.seek(0)
+    buf.truncate()
+    return buf
+
+@lru_cache(maxsize=1)
+def _executor():
+    """
+    Return the process-wide thread pool used to reduce columns in parallel.
+
+    Created on first use and sized to the number of CPUs. Threads are enough to use
+    every core because the fused kernel releases the GIL.
+    """
+    return ThreadPoolExecutor(max_workers=os.cpu_count(), thread_name_prefix="aggregate")
+
+@dataclass(slots=True)
+class StatsTable:
+    """
+    Per-column statistics stored as a structure of arrays.
+
+    Each statistic is one 1-D float64 NumPy array holding its value for every numeric
+    column, in the order of columns, so a whole statistic (e.g. all means) can be
+    scanned, sorted or compared with a single vectorized NumPy operation instead of
+    walking one dictionary per column. Indexing by column name, e.g.
+    stats['sales']['mean'], returns that column's statistics as a dictionary of Python
+    floats, matching the older nested layout.
+
+    Example:
+        stats = aggregate_data(df)
+        top = [stats.columns[i] for i in np.argsort(stats.mean)[::-1][:10]]
+        print(stats['sales'])  # Output: {'mean': 1425.0, 'sum': 5700.0, ...}
+    """
+
+    columns: tuple
+    """Numeric column names, in DataFrame order."""
+
+    mean: np.ndarray
+    """Mean of each column; NaN for columns with no values."""
+
+    sum: np.ndarray
+    """Sum of each column; 0.0 for columns with no values."""
+
+    min: np.ndarray
+    """Minimum of each column; NaN for columns with no values."""
+
+    max: np.ndarray
+    """Maximum of each column; NaN for columns with no values."""
+
+    def __getitem__(self, column):
+        """
+        Return the statistics of one column as {'mean': ..., 'sum': ..., 'min': ..., 'max': ...}.
+
+        Raises:
+            KeyError: If column is not one of the numeric columns.
+        """
+        try:
+            i = self.columns.index(column)
+        except ValueError:
+            raise KeyError(column) from None
+        return {
+            "mean": float(self.mean[i]),
+            "sum": float(self.sum[i]),
+            "min": float(self.min[i]),
+            "max": float(self.max[i])
+        }
+
+    def to_record_batch(self):
+        """
+        Return the table as an Arrow RecordBatch with columns name, mean, sum, min and max.
+
+        The statistic columns wrap the NumPy arrays without copying them, so the batch
+        can be handed to Arrow-aware consumers (IPC, Parquet, Arrow-backed caches)
+        without serializing each value. Column names are written as strings, whatever
+        their type in the DataFrame. Missing statistics stay NaN.
+        """
+        return pa.RecordBatch.from_arrays(
+            [
+                pa.array([str(col) for col in self.columns], type=pa.string()),
+                pa.array(self.mean),
+                pa.array(self.sum),
+                pa.array(self.min),
+                pa.array(self.max)
+            ],
+            names=["name", "mean", "sum", "min", "max"]
+        )
+
+    def to_ipc(self):
+        """
+        Return the table serialized in the Arrow IPC streaming format, schema included.
+
+        Readers load it back with pyarrow.ipc.open_stream(data).read_next_batch().
+        """
+        batch = self.to_record_batch()
+        sink = pa.BufferOutputStream()
+        with pa.ipc.new_stream(sink, batch.schema) as writer:
+            writer.write_batch(batch)
+        return sink.getvalue().to_pybytes()
+
+def aggregate_data(df, numeric=None):
     """
     Calculate comprehensive statistical summaries for numeric columns in a DataFrame.
 
@@ -10,40 +331,57 @@ def aggregate_data(df):
     of the dataset characteristics.
 
     The function automatically identifies numeric columns using pandas' type selection
-    capabilities, focusing only on columns with float64 and int64 data types. This
+    capabilities, covering every integer and floating-point dtype (including narrower
+    types such as float32 and int32, and Arrow-backed numeric columns). This
     selective approach ensures that calculations are performed only on appropriate
     numerical data while ignoring text, categorical, or other non-numeric columns.
-    The resulting dictionary structure makes it easy to access specific statistics
-    for individual columns or iterate through all computed measures.
+
+    Each column is reduced by the cheapest route its storage allows. Arrow-backed
+    columns, as produced by the loader, are reduced in place by Arrow's compute
+    kernels (a sum and a combined min/max). NumPy-backed columns without
+    missing values use NumPy's own sum, min and max reductions after a hasnans check.
+    Columns with missing values, and other extension-backed columns, go through a
+    compiled Numba kernel that computes all four statistics in one pass while
+    skipping NaN. Missing values are skipped on every route, as pandas does. Columns
+    are independent, so on large DataFrames they are reduced concurrently on a shared
+    thread pool, one column per task. When all numeric columns share one NumPy dtype
+    they are instead reduced together as a single 2-D block, with NumPy's sum, min
+    and max along axis 0 applied tile by tile, avoiding per-column dispatch entirely;
+    only block columns that contain NaN fall back to the Numba kernel.
+
+    Every column is read at the width it is stored in: float32 columns are not
+    widened to float64 first, so reducing them reads half the bytes. Sums are always
+    accumulated in float64 regardless of the width the values are read in.
 
     Args:
         df (pandas.DataFrame): Input DataFrame containing the data to analyze. Must
-                    contain at least one numeric column (float64 or int64)
-                    for meaningful aggregation results. The DataFrame can
+                    contain at least one numeric column (any integer or float
+                    dtype) for meaningful aggregation results. The DataFrame can
                     include mixed data types, but only numeric columns
                     will be processed.
 
+        numeric (pandas.DataFrame, optional): The numeric columns of df, as returned
+                    by numeric_view(df). Pass it when the caller has already
+                    selected them, to skip selecting them again. Defaults to None,
+                    in which case they are selected here.
+
     Returns:
-        dict: A nested dictionary where keys are column names of numeric columns
-                and values are dictionaries containing statistical measures. Each
-                inner dictionary contains 'mean', 'sum', 'min', and 'max' keys
-                with their corresponding calculated values for that specific column.
-
-                Example return format:
-                {
-                    'sales_amount': {
-                    'mean': 1250.50,
-                    'sum': 25000.0,
-                    'min': 100.0,
-                    'max': 5000.0
-                },
-                'quantity': {
-                        'mean': 25.3,
-                        'sum': 500,
-                        'min': 1,
-                        'max': 100
-                    }
-                }
+        StatsTable: The statistics in columnar form: the numeric column names in
+                'columns', and in each of 'mean', 'sum', 'min' and 'max' a 1-D
+                float64 NumPy array holding that statistic for every column, in the
+                same order. Keeping the values in arrays avoids creating a Python
+                object per value, and lets consumers operate on a whole statistic
+                at once. Index the table by column name, or use stats_by_column(),
+                for the per-column nested layout.
+
+                Example return value:
+                StatsTable(
+                    columns=('sales_amount', 'quantity'),
+                    mean=array([1250.5, 25.3]),
+                    sum=array([25000.0, 500.0]),
+                    min=array([100.0, 1.0]),
+                    max=array([5000.0, 100.0])
+                )
 
     Example:
         # Sample DataFrame
@@ -54,21 +392,125 @@ def aggregate_data(df):
         })
         
         stats = aggregate_data(df)
+        print(stats.columns)  # Output: ('sales', 'quantity')
+        print(stats.mean)  # Output: [1425.   14.25]
         print(stats['sales']['mean'])  # Output: 1425.0
-        print(stats['quantity']['max'])  # Output: 20
-    """
-    summary_stats = {}
-    numeric_cols = df.select_dtypes(include=['float64', 'int64']).columns
-    
-    for col in numeric_cols:
-        summary_stats[col] = {
-            "mean": df[col].mean(),
-            "sum": df[col].sum(),
-            "min": df[col].min(),
-            "max": df[col].max()
-        }
-    
-    return summary_stats
+    """
+    if numeric is None:
+        numeric = numeric_view(df)
+    if not numeric.shape[1]:
+        empty = np.empty(0)
+        return StatsTable(columns=(), mean=empty, sum=empty, min=empty, max=empty)
+    columns = [series for _, series in numeric.items()]
+
+    block = _homogeneous_block(numeric) if len(columns) > 1 else None
+    if block is not None:
+        means, totals, lowest, highest = _block_stats(block)
+    else:
+        if len(columns) > 1 and len(numeric) >= _PARALLEL_MIN_ROWS:
+            results = _executor().map(_column_stats, columns)
+        else:
+            results = map(_column_stats, columns)
+        per_column = np.array(list(results), dtype=np.float64).reshape(len(columns), 4)
+        means, totals, lowest, highest = np.ascontiguousarray(per_column.T)
+
+    return StatsTable(
+        columns=tuple(numeric.columns),
+        mean=means,
+        sum=totals,
+        min=lowest,
+        max=highest
+    )
+
+def aggregate_data_grouped(df, by, numeric=None):
+    """
+    Calculate the statistics of aggregate_data separately for each group of rows.
+
+    Rows are grouped by the values of one key column, as for a per-region or
+    per-product breakdown in a report. Instead of df.groupby(by).agg(...), which
+    dispatches per group in Python, the keys are factorized into integer codes and
+    the rows are sorted by code once; every statistic of every column is then computed
+    for all groups at once with NumPy's reduceat, a single sorted scan in C. Missing
+    values are skipped, as in aggregate_data. Rows whose key is missing are left out,
+    as pandas does.
+
+    Args:
+        df (pandas.DataFrame): Input DataFrame containing the data to analyze.
+
+        by (str): Name of the column whose values define the groups. It is not
+                    aggregated itself, even if numeric.
+
+        numeric (pandas.DataFrame, optional): The numeric columns of df, as returned
+                    by numeric_view(df). Defaults to None, in which case they are
+                    selected here.
+
+    Returns:
+        dict: {group key: StatsTable} with one table per distinct key, in sorted key
+                order. Every table has the same columns. Statistics are computed in
+                float64.
+
+    Example:
+        df = pd.DataFrame({
+            'region': ['north', 'south', 'north'],
+            'sales': [1000, 1500, 2000]
+        })
+
+        stats = aggregate_data_grouped(df, 'region')
+        print(stats['north']['sales'])  # Output: {'mean': 1500.0, 'sum': 3000.0, ...}
+    """
+    if numeric is None:
+        numeric = numeric_view(df)
+    numeric = numeric.drop(columns=by, errors="ignore")
+    codes, keys = pd.factorize(df[by], sort=True)
+    order = np.argsort(codes, kind="stable")
+    order = order[codes[order] >= 0]
+    if not len(order):
+        return {}
+    sorted_codes = codes[order]
+    edges = np.flatnonzero(np.r_[True, sorted_codes[1:] != sorted_codes[:-1]])
+
+    shape = (len(edges), numeric.shape[1])
+    means, totals, lowest, highest = (np.empty(shape) for _ in range(4))
+    for j, (_, series) in enumerate(numeric.items()):
+        values = series.to_numpy(dtype=np.float64, na_value=np.nan)[order]
+        missing = np.isnan(values)
+        counts = np.add.reduceat(~missing, edges, dtype=np.intp)
+        totals[:, j] = np.add.reduceat(np.where(missing, 0.0, values), edges)
+        lowest[:, j] = np.fmin.reduceat(values, edges)
+        highest[:, j] = np.fmax.reduceat(values, edges)
+        with np.errstate(invalid="ignore", divide="ignore"):
+            means[:, j] = totals[:, j] / counts
+
+    columns = tuple(numeric.columns)
+    return {
+        key: StatsTable(columns=columns, mean=means[g], sum=totals[g], min=lowest[g], max=highest[g])
+        for g, key in enumerate(keys.tolist())
+    }
+
+def stats_by_column(stats):
+    """
+    Convert aggregate_data output into the per-column nested dictionary layout.
+
+    For callers that want the statistics of one column at a time, e.g.
+    stats_by_column(stats)['sales']['mean']. The values are returned as Python floats.
+
+    Args:
+        stats (StatsTable): Columnar statistics as returned by aggregate_data.
+
+    Returns:
+        dict: {column: {'mean': ..., 'sum': ..., 'min': ..., 'max': ...}}
+    """
+    pairs = [
+        (col, {"mean": mean, "sum": total, "min": lowest, "max": highest})
+        for col, mean, total, lowest, highest in zip(
+            stats.columns,
+            stats.mean.tolist(),
+            stats.sum.tolist(),
+            stats.min.tolist(),
+            stats.max.tolist()
+        )
+    ]
+    return dict(pairs)
 
 def prepare_context_for_ai(df, stats):
     """
@@ -88,24 +530,39 @@ def prepare_context_for_ai(df, stats):
     enables AI systems to perform both granular analysis and high-level pattern
     recognition on the provided dataset.
 
+    The sample rows are written as tab-separated values under a tab-separated header
+    row. They are built directly from the raw cell values, read as plain tuples with
+    itertuples(), instead of going through DataFrame.to_string(), whose column
+    alignment and per-dtype formatting machinery is far more work than five rows need
+    and adds padding the AI does not need. Each column keeps its own type, so integer
+    columns are not widened to floats, and floats are written in the short %g form
+    (six significant digits) to spend fewer tokens.
+    The statistics are given per column, in the nested layout of stats_by_column, so
+    the AI reads each column's values together instead of lining them up by position
+    across parallel arrays. They are serialized as compact JSON with orjson, which is
+    much faster than Python's repr and yields shorter text (missing values become
+    null), so fewer tokens are sent to the AI. The pieces are
+    written into a reusable per-thread buffer rather than joined into intermediate
+    strings.
+
     Args:
         df (pandas.DataFrame): The original DataFrame containing the data to be
             analyzed. This DataFrame provides the sample data
             (first 5 rows) that will be included in the context.
 
-        stats (dict): Dictionary containing statistical summaries as returned by
-                the aggregate_data function. This dictionary provides the
-                numerical insights that complement the sample data.
+        stats (StatsTable): Columnar statistical summaries as returned by the
+                aggregate_data function. These provide the numerical
+                insights that complement the sample data.
 
     Returns:
         str: Formatted string containing both the first 5 rows of the DataFrame
             and the statistical summaries in a structured format. The returned
             string follows the pattern:
             "Data Head:
-                [first 5 rows of DataFrame as formatted string]
+                [tab-separated header row and first 5 rows of DataFrame]
             
                 Statistics:
-                [string representation of stats dictionary]"
+                [per-column stats as compact JSON]"
 
             This format is optimized for AI consumption, providing both sample
                 data and statistical context in a clear, readable structure.
@@ -116,13 +573,41 @@ def prepare_context_for_ai(df, stats):
             'users': [100, 150, 200, 120, 180]
         })
         
-        stats = {'revenue': {'mean': 1500, 'sum': 7500}, 'users': {'mean': 150, 'sum': 750}}
+        stats = aggregate_data(df)
         
         context = prepare_context_for_ai(df, stats)
         print(context)
         # Output will contain both the first 5 rows and the statistical summary
     """
-    head_data = df.head(5).to_string()
-    stats_string = str(stats)
-    context = f"Data Head:\n{head_data}\n\nStatistics:\n{stats_string}"
-    return context
\ No newline at end of file
+    buf = _context_buffer()
+    buf.write("Data Head:\n")
+    buf.write("\t".join(map(str, df.columns)))
+    for row in df.iloc[:5].itertuples(index=False, name=None):
+        buf.write("\n")
+        buf.write("\t".join(f"{v:g}" if isinstance(v, float) else str(v) for v in row))
+    buf.write("\n\nStatistics:\n")
+    buf.write(orjson.dumps(stats_by_column(stats), option=orjson.OPT_NON_STR_KEYS).decode())
+    return buf.getvalue()
+
+def build_report(df):
+    """
+    Compute the statistics of an uploaded DataFrame and the AI context built from them.
+
+    This is the single entry point the analysis pipeline uses. The numeric columns are
+    selected once here and passed to aggregate_data, so the frame's dtypes are
+    inspected a single time per report. The context's sample rows still show every
+    column, including non-numeric ones, since those help the AI interpret the data.
+
+    Args:
+        df (pandas.DataFrame): The validated upload to analyze.
+
+    Returns:
+        tuple: (stats, context), where stats is the StatsTable from aggregate_data and
+            context the string from prepare_context_for_ai.
+
+    Example:
+        stats, context = build_report(df)
+        insights = generate_insights(context)
+    """
+    stats = aggregate_data(df, numeric=numeric_view(df))
+    return stats, prepare_context_for_ai(df, stats)
\ No newline at end of file
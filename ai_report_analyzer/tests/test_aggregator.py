@@ -0,0 +1,147 @@
+import numpy as np
+import pandas as pd
+import pyarrow as pa
+import pytest
+from app.processing.aggregator import aggregate_data, aggregate_data_grouped, prepare_context_for_ai, stats_by_column
+
+def test_aggregate_data_numeric_columns():
+    df = pd.DataFrame({
+        "sales": [1000, 1500, 2000, 1200],
+        "quantity": [10.0, 15.0, 20.0, 12.0],
+        "name": ["A", "B", "C", "D"]
+    })
+    stats = stats_by_column(aggregate_data(df))
+    assert set(stats) == {"sales", "quantity"}
+    assert stats["sales"] == {"mean": 1425.0, "sum": 5700, "min": 1000, "max": 2000}
+    assert stats["quantity"]["max"] == 20.0
+
+def test_aggregate_data_returns_stats_table():
+    df = pd.DataFrame({"sales": [1000, 2000], "quantity": [10.0, 30.0]})
+    stats = aggregate_data(df)
+    assert stats.columns == ("sales", "quantity")
+    np.testing.assert_array_equal(stats.mean, [1500.0, 20.0])
+    assert stats["quantity"] == {"mean": 20.0, "sum": 40.0, "min": 10.0, "max": 30.0}
+    with pytest.raises(KeyError):
+        stats["name"]
+
+def test_stats_table_to_arrow():
+    stats = aggregate_data(pd.DataFrame({"sales": [1000, 2000], "quantity": [10.0, 30.0]}))
+    batch = stats.to_record_batch()
+    assert batch.schema.names == ["name", "mean", "sum", "min", "max"]
+    assert batch.column(0).to_pylist() == ["sales", "quantity"]
+    assert batch.column(2).to_pylist() == [3000.0, 40.0]
+    assert pa.ipc.open_stream(stats.to_ipc()).read_next_batch().equals(batch)
+
+def test_stats_table_to_arrow_with_non_string_columns():
+    stats = aggregate_data(pd.DataFrame({0: [1.0, 2.0], 1: [3, 4]}))
+    assert stats.to_record_batch().column(0).to_pylist() == ["0", "1"]
+
+def test_aggregate_data_includes_narrow_dtypes():
+    df = pd.DataFrame({"ratio": pd.Series([0.5, 1.5], dtype="float32")})
+    stats = stats_by_column(aggregate_data(df))
+    assert stats["ratio"]["sum"] == 2.0
+
+def test_aggregate_data_ignores_complex_columns():
+    df = pd.DataFrame({"signal": np.array([1 + 2j, 3 - 1j]), "units": [1, 2]})
+    assert aggregate_data(df).columns == ("units",)
+
+def test_aggregate_data_float16_with_missing_values():
+    values = np.array([1, np.nan, 3], dtype="float16")
+    stats = stats_by_column(aggregate_data(pd.DataFrame({"a": values, "b": values})))
+    assert stats["a"] == {"mean": 2.0, "sum": 4.0, "min": 1.0, "max": 3.0}
+    single = stats_by_column(aggregate_data(pd.DataFrame({"a": values})))
+    assert single["a"] == stats["a"]
+
+def test_aggregate_data_without_numeric_columns():
+    df = pd.DataFrame({"name": ["A", "B"]})
+    stats = aggregate_data(df)
+    assert stats.columns == ()
+    assert stats.mean.shape == (0,)
+
+def test_aggregate_data_skips_missing_values():
+    df = pd.DataFrame({
+        "revenue": [1.0, None, 3.0],
+        "empty": [None, None, None],
+        "units": pd.array([2, None, 4], dtype=pd.ArrowDtype(pa.int64()))
+    }).astype({"empty": "float64"})
+    stats = stats_by_column(aggregate_data(df))
+    assert stats["revenue"] == {"mean": 2.0, "sum": 4.0, "min": 1.0, "max": 3.0}
+    assert stats["empty"]["sum"] == 0.0
+    assert np.isnan(stats["empty"]["mean"])
+    assert stats["units"] == {"mean": 3.0, "sum": 6.0, "min": 2.0, "max": 4.0}
+
+def test_aggregate_data_arrow_backed_columns():
+    df = pd.DataFrame({
+        "price": pd.array([1.5, None, 2.5], dtype=pd.ArrowDtype(pa.float64())),
+        "blank": pd.array([None, None, None], dtype=pd.ArrowDtype(pa.float64()))
+    })
+    stats = stats_by_column(aggregate_data(df))
+    assert stats["price"] == {"mean": 2.0, "sum": 4.0, "min": 1.5, "max": 2.5}
+    assert stats["blank"]["sum"] == 0.0
+    assert np.isnan(stats["blank"]["min"])
+
+def test_aggregate_data_arrow_integer_sum_does_not_overflow():
+    df = pd.DataFrame({"id": pd.array([2**62] * 3, dtype=pd.ArrowDtype(pa.int64()))})
+    stats = stats_by_column(aggregate_data(df))["id"]
+    assert stats["sum"] == 3.0 * 2**62
+    assert stats["mean"] == 2.0**62
+
+def test_aggregate_data_parallel_matches_serial():
+    rows = 200_000
+    df = pd.DataFrame({
+        "a": np.arange(rows, dtype="float64"),
+        "b": np.ones(rows, dtype="int64")
+    })
+    stats = stats_by_column(aggregate_data(df))
+    assert stats["a"]["max"] == rows - 1
+    assert stats["b"] == {"mean": 1.0, "sum": float(rows), "min": 1.0, "max": 1.0}
+
+def test_aggregate_data_homogeneous_block_with_missing_values():
+    df = pd.DataFrame({
+        "a": [1.0, 2.0, 3.0],
+        "b": [4.0, np.nan, 6.0]
+    })
+    stats = stats_by_column(aggregate_data(df))
+    assert stats["a"] == {"mean": 2.0, "sum": 6.0, "min": 1.0, "max": 3.0}
+    assert stats["b"] == {"mean": 5.0, "sum": 10.0, "min": 4.0, "max": 6.0}
+
+def test_aggregate_data_grouped():
+    df = pd.DataFrame({
+        "region": ["south", "north", None, "north", "south"],
+        "sales": [1500, 1000, 9999, 2000, 2500],
+        "returns": [np.nan, 1.0, 5.0, 3.0, np.nan]
+    })
+    stats = aggregate_data_grouped(df, "region")
+    assert list(stats) == ["north", "south"]
+    assert stats["north"].columns == ("sales", "returns")
+    assert stats["north"]["sales"] == {"mean": 1500.0, "sum": 3000.0, "min": 1000.0, "max": 2000.0}
+    assert stats["north"]["returns"] == {"mean": 2.0, "sum": 4.0, "min": 1.0, "max": 3.0}
+    assert stats["south"]["returns"]["sum"] == 0.0
+    assert np.isnan(stats["south"]["returns"]["mean"])
+
+def test_aggregate_data_block_tiling_matches_numpy():
+    rng = np.random.default_rng(0)
+    for shape in [(40_000, 4), (2_000, 300)]:
+        values = rng.random(shape)
+        stats = aggregate_data(pd.DataFrame(values))
+        np.testing.assert_allclose(stats.sum, values.sum(axis=0))
+        np.testing.assert_array_equal(stats.min, values.min(axis=0))
+        np.testing.assert_array_equal(stats.max, values.max(axis=0))
+
+def test_prepare_context_for_ai_formats_head_as_tsv():
+    df = pd.DataFrame({"region": ["north", "south"], "revenue": [1000, 1500]})
+    context = prepare_context_for_ai(df, aggregate_data(df))
+    assert context.startswith("Data Head:\nregion\trevenue\nnorth\t1000\nsouth\t1500\n\nStatistics:\n")
+
+def test_prepare_context_for_ai_formats_floats_compactly():
+    df = pd.DataFrame({"price": [2.50, 1234567.0], "units": [3, 4]})
+    context = prepare_context_for_ai(df, aggregate_data(df))
+    assert context.startswith("Data Head:\nprice\tunits\n2.5\t3\n1.23457e+06\t4\n\n")
+
+def test_prepare_context_for_ai_serializes_stats_as_json():
+    stats = aggregate_data(pd.DataFrame({"revenue": [1000.0, 1501.0], "empty": [np.nan, np.nan]}))
+    context = prepare_context_for_ai(pd.DataFrame({"revenue": [1000.0]}), stats)
+    assert context.endswith(
+        'Statistics:\n{"revenue":{"mean":1250.5,"sum":2501.0,"min":1000.0,"max":1501.0},'
+        '"empty":{"mean":null,"sum":0.0,"min":null,"max":null}}'
+    )
@@ -0,0 +1,48 @@
+import io
+import pandas as pd
+import pytest
+from app.ingestion import loader
+from app.ingestion.loader import UploadTooLargeError, load_csv_stream, validate_dataframe
+
+@pytest.fixture(autouse=True)
+def empty_schema_cache():
+    loader._schema_cache.clear()
+    yield
+    loader._schema_cache.clear()
+
+def _load(text, filename=None):
+    return load_csv_stream(io.BytesIO(text.encode()), filename)
+
+def test_load_csv_stream_uses_arrow_dtypes():
+    df = _load("region,amount\nnorth,5\nsouth,6\n")
+    assert isinstance(df["amount"].dtype, pd.ArrowDtype)
+    assert df["amount"].tolist() == [5, 6]
+
+def test_load_csv_stream_falls_back_to_pandas_for_ragged_rows():
+    df = _load("a,b\n1,2\n3\n")
+    assert len(df) == 2
+    assert df["a"].tolist() == [1, 3]
+    assert df["b"].isna().tolist() == [False, True]
+
+def test_load_csv_stream_reuses_numeric_types_for_filename():
+    _load("amount,label\n5,x\n6,y\n", "report.csv")
+    assert set(loader._schema_cache["report.csv"]) == {"amount"}
+    df = _load("amount,label\n7,z\n", "report.csv")
+    assert df["amount"].tolist() == [7]
+
+def test_load_csv_stream_does_not_pin_text_columns():
+    _load("amount\n$5\n$6\n", "report.csv")
+    df = _load("amount\n5\n6\n", "report.csv")
+    assert pd.api.types.is_integer_dtype(df["amount"].dtype)
+
+def test_load_csv_stream_discards_stale_cached_types():
+    _load("amount\n5\n6\n", "report.csv")
+    df = _load("amount\n$5\n$6\n", "report.csv")
+    assert df["amount"].tolist() == ["$5", "$6"]
+    assert "amount" not in loader._schema_cache["report.csv"]
+
+def test_validate_dataframe_limits():
+    with pytest.raises(ValueError):
+        validate_dataframe(pd.DataFrame())
+    with pytest.raises(UploadTooLargeError):
+        validate_dataframe(pd.DataFrame({"a": [1, 2, 3]}), max_rows=2)
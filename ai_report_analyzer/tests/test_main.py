@@ -1,12 +1,61 @@
+import pytest
 from fastapi.testclient import TestClient
+from app import main
+from app.database.connection import Base, engine
 from app.main import app
 
-client = TestClient(app)
+async def _create_tables():
+    async with engine.begin() as conn:
+        await conn.run_sync(Base.metadata.create_all)
 
-def test_read_main():
+@pytest.fixture(scope="module")
+def client():
+    with TestClient(app) as client:
+        client.portal.call(_create_tables)
+        yield client
+
+def test_read_main(client):
     response = client.get("/reports")
     assert response.status_code == 200
 
-def test_upload_report_failure():
+def test_upload_report_failure(client):
     response = client.post("/upload")
-    assert response.status_code == 422
\ No newline at end of file
+    assert response.status_code == 422
+
+def test_read_reports_rejects_invalid_limit(client):
+    response = client.get("/reports", params={"limit": 0})
+    assert response.status_code == 422
+
+def _upload(client, content=b"region,revenue\nnorth,1000\nsouth,1500\n"):
+    return client.post("/upload", files={"file": ("report.csv", content, "text/csv")})
+
+def test_upload_report_runs_analysis_in_background(client, monkeypatch):
+    monkeypatch.setattr(main, "generate_insights", lambda context: '{"overall_score": 80}')
+    response = _upload(client)
+    assert response.status_code == 202
+    assert response.json()["status"] == "pending"
+    report = client.get(f"/reports/{response.json()['report_id']}").json()
+    assert report["status"] == "done"
+    assert report["insight_score"] == 80.0
+    assert report["summary_text"] == '{"overall_score":80}'
+
+def test_upload_report_marks_failed_analysis(client, monkeypatch):
+    def fail(context):
+        raise RuntimeError("quota exceeded")
+    monkeypatch.setattr(main, "generate_insights", fail)
+    report_id = _upload(client).json()["report_id"]
+    assert client.get(f"/reports/{report_id}").json()["status"] == "failed"
+
+def test_upload_report_marks_failed_storage(client, monkeypatch):
+    monkeypatch.setattr(main, "generate_insights", lambda context: "plain text")
+    store_results = main._store_results
+    async def fail_with_results(report_id, values, rows):
+        if rows:
+            raise RuntimeError("insert failed")
+        await store_results(report_id, values, rows)
+    monkeypatch.setattr(main, "_store_results", fail_with_results)
+    report_id = _upload(client).json()["report_id"]
+    assert client.get(f"/reports/{report_id}").json()["status"] == "failed"
+
+def test_upload_report_rejects_empty_file(client):
+    assert _upload(client, b"region,revenue\n").status_code == 500